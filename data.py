@@ -1,7 +1,13 @@
-import json
+import mmap
+import os
+
+import orjson
 
 from models import Project, Task
 
+# The bytes last written to each file, used to skip saves that would not change it.
+_last_saved: dict[str, bytes] = {}
+
 def load_projects(filename="projects.json") -> list[Project]:
     """
     Load projects from a JSON file.
@@ -11,56 +17,72 @@ def load_projects(filename="projects.json") -> list[Project]:
         list[Project]: A list of Project objects loaded from the file. If the file does not exist or is empty, returns an empty list.
     Raises:
         FileNotFoundError: If the specified file does not exist.
-        json.JSONDecodeError: If the file contains invalid JSON.
+        orjson.JSONDecodeError: If the file contains invalid JSON.
+    The file is memory-mapped read-only and parsed in place, avoiding a copy of its contents.
+    If the file cannot be memory-mapped, for example on a file system that does not support it, it is read normally instead.
+    Each project's tasks are sorted by priority and renumbered from 1 by position, which the rest of the application relies on,
+    so files with gaps or duplicates in their priorities are loaded consistently.
     """
     try:
-        with open(filename, "r") as file:
-            data = json.load(file)
+        with open(filename, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return []
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except OSError:
+                data = orjson.loads(file.read())
+            else:
+                with mapped, memoryview(mapped) as view:
+                    data = orjson.loads(view)
             projects = []
             for proj in data:
-                tasks = [Task(**t) for t in proj.get("tasks", [])]
-                projects.append(Project(
-                    name=proj["name"],
-                    description=proj.get("description", "No description provided."),
-                    tasks=tasks
-                ))
+                tasks = [Task(t["name"], t.get("completed", False), t.get("priority", 1)) for t in proj.get("tasks", [])]
+                tasks.sort(key=lambda t: t.priority)
+                for index, task in enumerate(tasks, 1):
+                    task.priority = index
+                projects.append(Project(proj["name"], proj.get("description", "No description provided."), tasks))
             return projects
     except FileNotFoundError:
         return []
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print("Error decoding JSON. Starting with an empty project list.")
         return []
 
-def save_projects(projects, filename="projects.json") -> bool:
+def serialize_projects(projects) -> bytes:
+    """
+    Serialize projects to JSON.
+    Args:
+        projects (list[Project]): A list of Project objects to serialize.
+    Returns:
+        bytes: The projects encoded as indented JSON.
+    The Project and Task dataclasses are serialized natively by orjson, so no intermediate dictionaries are built.
+    """
+    return orjson.dumps(projects, option=orjson.OPT_INDENT_2)
+
+def write_projects(buffer, filename="projects.json") -> bool:
     """
-    Save projects to a JSON file.
+    Write serialized projects to a JSON file.
     Args:
-        projects (list[Project]): A list of Project objects to save.
-        filename (str): The name of the JSON file to save projects to. Defaults to "projects.json".
+        buffer (bytes): The serialized projects, as returned by serialize_projects.
+        filename (str): The name of the JSON file to write to. Defaults to "projects.json".
     Returns:
-        bool: True if the projects were saved successfully, False otherwise.
+        bool: True if the projects were written successfully, False otherwise.
     Raises:
         IOError: If there is an error writing to the file.
         OSError: If there is an error with the file system.
-    This function serializes the list of Project objects to JSON format and writes it to the specified file.
+    The data is written to a temporary file which then replaces the destination, so a crash mid-write cannot corrupt it.
+    If the data is identical to what was last written to the file, the write is skipped.
     """
     try:
-        def project_to_dict(proj) -> dict:
-            """
-            Convert a Project object to a dictionary for JSON serialization.
-            Args:
-                proj (Project): The Project object to convert.
-            Returns:
-                dict: A dictionary representation of the Project object.
-            This function is used to ensure that the Project and Task objects can be serialized to JSON.
-            """
-            return {
-                "name": proj.name,
-                "description": proj.description,
-                "tasks": [task.__dict__ for task in proj.tasks]
-            }
-        with open(filename, "w") as file:
-            json.dump([project_to_dict(proj) for proj in projects], file, indent=4)
+        if _last_saved.get(filename) == buffer:
+            return True
+        temp_filename = filename + ".tmp"
+        with open(temp_filename, "wb") as file:
+            file.write(buffer)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_filename, filename)
+        _last_saved[filename] = buffer
     except (IOError, OSError) as e:
         print(f"Error saving projects: {e}")
         return False
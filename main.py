@@ -1,42 +1,108 @@
 from PySide6.QtWidgets import (
     QMainWindow, QApplication, QHBoxLayout, QVBoxLayout, QPushButton, QLineEdit,
-    QTextEdit, QInputDialog, QWidget, QLabel, QCheckBox, QDialog, QMessageBox,
+    QTextEdit, QWidget, QLabel, QCheckBox, QDialog, QMessageBox,
     QStackedWidget
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QThreadPool, QRunnable
 from PySide6.QtGui import QIcon
 
-from dataclasses import dataclass, field
-
 import sys
-import json
+from functools import cache, partial
 
-from style import Style
-from data import load_projects, save_projects
+from style import get_style
+from data import load_projects, serialize_projects, write_projects
 from models import Project, Task
 from task_managing import TaskManager
 
+@cache
+def app_icon() -> QIcon:
+    """
+    Returns the application icon.
+    Returns:
+        QIcon: The icon loaded from "icon.png" on first use and shared by every window and dialog afterwards.
+    """
+    return QIcon("icon.png")
+
+class SaveProjectsTask(QRunnable):
+    """
+    Runnable that writes serialized projects to a JSON file on a worker thread.
+    Attributes:
+        buffer (bytes): The serialized projects to write.
+        filename (str): The name of the JSON file to write to.
+    Methods:
+        run(): Writes the buffer to the file.
+    The projects are serialized on the GUI thread before the task is created, so the worker never
+    reads Project or Task objects while the UI may be changing them.
+    """
+    def __init__(self, buffer, filename="projects.json") -> None:
+        """
+        Initializes the task.
+        Args:
+            buffer (bytes): The serialized projects to write.
+            filename (str): The name of the JSON file to write to. Defaults to "projects.json".
+        """
+        super().__init__()
+        self.buffer = buffer
+        self.filename = filename
+
+    def run(self) -> None:
+        """
+        Writes the buffer to the file.
+        """
+        write_projects(self.buffer, self.filename)
+
 class MainWindow(QMainWindow):
     """
     Main window class for the Project Manager application.
     This class initializes the main window, sets up the UI, and handles user interactions.
     Attributes:
         projects (list[Project]): A list of Project objects loaded from the JSON file.
+        projects_by_name (dict[str, Project]): The projects keyed by name, used to check new names are unique.
+            If a hand-edited file holds several projects with the same name, the first one is indexed.
         mode (int): The current mode of the application (0 for dark mode, 1 for light mode).
         current_project (Project): The currently selected project.
+        project_view (QWidget): The project view, or None until a project is first opened.
         main_view_initialized (bool): Flag to check if the main view has been initialized.
         project_view_initialized (bool): Flag to check if the project view has been initialized.
+        project_rows (dict[int, tuple]): The row widgets of each project in the main view, keyed by the project's id.
+        task_rows (dict[int, tuple]): The row widgets of each task in the project view, keyed by the task's id.
+        task_row_pool (list[tuple]): Hidden task rows that are no longer shown, kept to be reused for other tasks.
+        tasks_by_id (dict[int, Task]): The tasks of the current project keyed by id, used to find the task of a row.
+        toggle_mode_button (QPushButton): The toggle mode button, shared by both views.
+        main_toggle_layout (QHBoxLayout): The layout holding the toggle mode button in the main view.
+        project_toggle_layout (QHBoxLayout): The layout holding the toggle mode button in the project view.
         task_manager (TaskManager): Instance for managing tasks.
+        save_timer (QTimer): Single-shot timer used to coalesce saves.
+        refresh_timer (QTimer): Zero-interval single-shot timer used to coalesce UI refreshes.
+        save_pool (QThreadPool): Single-threaded pool that writes the projects file off the GUI thread.
     Methods:
         __init__(): Initializes the main window and sets up the UI.
         setup_main_view(): Sets up the main view of the application.
+        build_main_view(): Builds the persistent widgets of the main view.
+        sync_project_rows(): Updates the project rows to match the list of projects.
+        create_project_row(project): Creates the row of widgets for a project.
         setup_project_view(): Sets up the project view for managing tasks.
+        build_project_view(): Builds the persistent widgets of the project view.
+        sync_task_rows(): Updates the task rows to match the tasks of the current project.
+        take_task_row(task): Returns a row of widgets for a task, reusing a pooled row if there is one.
+        create_task_row(): Creates the row of widgets for a task.
+        sender_task(): Returns the task of the row whose widget emitted the current signal.
+        on_priority_clicked(): Changes the priority of the task whose priority button was clicked.
+        on_task_state_changed(state): Updates the completion of the task whose checkbox changed.
+        on_remove_task_clicked(): Removes the task whose remove button was clicked.
+        place_toggle_mode_button(layout): Moves the toggle mode button into the layout of the view being shown.
         toggle_mode(): Toggles between light and dark mode.
+        update_style_sheets(): Installs the style sheet for the current mode on the application.
+        schedule_save(projects=None): Schedules the projects to be saved to the JSON file.
+        start_save(): Serializes the projects and writes them to the JSON file on the save thread.
+        flush_save(): Saves the projects immediately if a save is pending, and waits for all writes to finish.
+        closeEvent(event): Flushes any pending save before the window closes.
         clear_projects(): Clears all projects after user confirmation.
         edit_project_details(project, mode="edit"): Opens a dialog to edit project details.
+        unindex_project(project): Removes a project from projects_by_name, passing its name to a duplicate if there is one.
+        request_refresh(): Schedules a UI refresh for the next pass of the event loop.
         refresh_ui(): Refreshes the UI based on the current view.
         delete_project(project): Deletes a project after user confirmation.
-        clear_layout(layout): Clears all widgets from a layout.
         show_project_view(project): Displays the project view for the selected project.
         show_main_view(): Displays the main view of the application.
     """
@@ -47,29 +113,55 @@ class MainWindow(QMainWindow):
         """
         super().__init__()
         self.projects = load_projects()
+        self.projects_by_name = {}
+        for project in self.projects:
+            self.projects_by_name.setdefault(project.name, project)
 
         self.mode = 1
+        self.update_style_sheets()
 
         self.current_project = None
         
         self.main_view_initialized = False
         self.project_view_initialized = False
+        self.project_rows = {}
+        self.task_rows = {}
+        self.task_row_pool = []
+        self.tasks_by_id = {}
+        
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(250)
+        self.save_timer.timeout.connect(self.start_save)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(0)
+        self.refresh_timer.timeout.connect(self.refresh_ui)
+        
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(1)
         
-        self.task_manager = TaskManager(self.projects, save_projects)
+        self.task_manager = TaskManager(self.projects, self.schedule_save)
+
+        self.toggle_mode_button = QPushButton("🌙" if self.mode == 0 else "☀️")
+        self.toggle_mode_button.setProperty("large", True)
+        self.toggle_mode_button.clicked.connect(self.toggle_mode)
+        self.toggle_mode_button.setFixedWidth(120)
+        self.toggle_mode_button.setShortcut("Ctrl+T")
+        self.toggle_mode_button.setToolTip("Toggle light/dark mode (Ctrl+T)")
 
         self.setWindowTitle("Project Manager")
-        self.setWindowIcon(QIcon("icon.png"))
-        self.setStyleSheet(Style(self.mode).style_sheet(1))
+        self.setWindowIcon(app_icon())
         self.setGeometry(100, 100, 800, 600)
         
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
         
         self.main_view = QWidget()
-        self.project_view = QWidget()
-        
         self.stacked_widget.addWidget(self.main_view)
-        self.stacked_widget.addWidget(self.project_view)
+
+        self.project_view = None
         
         self.setup_main_view()
         
@@ -78,112 +170,197 @@ class MainWindow(QMainWindow):
     def setup_main_view(self) -> None:
         """
         Sets up the main view of the application.
-        This method initializes the layout, adds buttons for adding projects, and displays the list of current projects.
+        The header buttons, the "no current projects" message and the toggle mode button are built once,
+        and the project rows are kept alive between refreshes and updated in place.
         If there are no projects, it displays a message indicating that there are no current projects.
+        Updates are disabled while the rows change, so the view is repainted once at the end.
         """
-        if not self.main_view_initialized:
-            layout = QVBoxLayout()
-            self.main_view.setLayout(layout)
-            self.main_view_initialized = True
-        else:
-            current_layout = self.main_view.layout()
-            self.clear_layout_content(current_layout)
-        
-        layout = self.main_view.layout()
-        assert isinstance(layout, QVBoxLayout)
+        self.main_view.setUpdatesEnabled(False)
+        try:
+            if not self.main_view_initialized:
+                self.build_main_view()
+
+            self.no_projects_widget.setVisible(not self.projects)
+            self.clear_projects_button.setVisible(len(self.projects) > 1)
+
+            self.sync_project_rows()
+        finally:
+            self.main_view.setUpdatesEnabled(True)
+
+    def build_main_view(self) -> None:
+        """
+        Builds the persistent widgets of the main view.
+        This method adds the add project and clear projects buttons, the "no current projects" message,
+        the layout holding the project rows and the toggle mode button.
+        """
+        layout = QVBoxLayout()
+        self.main_view.setLayout(layout)
 
         horizontal_layout = QHBoxLayout()
         
         add_project_button = QPushButton("Add Project")
         add_project_button.clicked.connect(lambda: self.edit_project_details(Project(name="", description=""), mode="add"))
-        add_project_button.setStyleSheet(Style(self.mode).style_sheet(2))
+        add_project_button.setProperty("large", True)
         horizontal_layout.addWidget(add_project_button, alignment=Qt.AlignmentFlag.AlignTop)
 
         add_project_button.setShortcut("Ctrl+N")
         add_project_button.setToolTip("Add a new project (Ctrl+N)")
 
+        self.clear_projects_button = QPushButton("Clear Projects")
+        self.clear_projects_button.clicked.connect(self.clear_projects)
+        self.clear_projects_button.setProperty("large", True)
+        horizontal_layout.addWidget(self.clear_projects_button, alignment=Qt.AlignmentFlag.AlignTop)
+        
+        self.clear_projects_button.setShortcut("Ctrl+C")
+        self.clear_projects_button.setToolTip("Clear all projects (Ctrl+C)")
+
         layout.addLayout(horizontal_layout)
 
-        if not self.projects:
-            no_projects_label = QLabel("No current projects.")
-            no_projects_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addStretch(1)
-            layout.addWidget(no_projects_label)
-            no_projects_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addStretch(1)
-            
-            layout.addStretch(2)
-            
-            toggle_layout = QHBoxLayout()
-            toggle_layout.addStretch()
-            
-            toggle_mode_button = QPushButton("🌙" if self.mode == 0 else "☀️")
-            toggle_mode_button.setStyleSheet(Style(self.mode).style_sheet(2))
-            toggle_mode_button.clicked.connect(lambda: self.toggle_mode())
-            toggle_mode_button.setFixedWidth(120)
-            toggle_mode_button.setShortcut("Ctrl+T")
-            toggle_mode_button.setToolTip("Toggle light/dark mode (Ctrl+T)")
-            toggle_layout.addWidget(toggle_mode_button)
-            
-            layout.addLayout(toggle_layout)
-            return
-        else:
-            if len(self.projects) > 1:
-                clear_projects_button = QPushButton("Clear Projects")
-                clear_projects_button.clicked.connect(lambda: self.clear_projects())
-                clear_projects_button.setStyleSheet(Style(self.mode).style_sheet(2))
-                horizontal_layout.addWidget(clear_projects_button, alignment=Qt.AlignmentFlag.AlignTop)
-                
-                clear_projects_button.setShortcut("Ctrl+C")
-                clear_projects_button.setToolTip("Clear all projects (Ctrl+C)")
-
-            for project in self.projects:
-
-                horizontal_layout = QHBoxLayout()
-                
-                project_label = QPushButton(project.name)
-                project_label.clicked.connect(lambda _, p=project: self.show_project_view(p))
-                project_label.setStyleSheet(Style(self.mode).style_sheet(2))
-                horizontal_layout.addWidget(project_label)
-
-                edit_details_button = QPushButton("Edit Details")
-                edit_details_button.clicked.connect(lambda _, p=project: self.edit_project_details(p))
-                edit_details_button.setStyleSheet(Style(self.mode).style_sheet(2))
-                horizontal_layout.addWidget(edit_details_button)
-
-                delete_project_button = QPushButton("Delete")
-                delete_project_button.clicked.connect(lambda _, p=project: self.delete_project(p))
-                delete_project_button.setStyleSheet(Style(self.mode).style_sheet(2))
-                horizontal_layout.addWidget(delete_project_button)
-
-                layout.addLayout(horizontal_layout)
-
-            layout.addStretch()
-            
-            toggle_layout = QHBoxLayout()
-            toggle_layout.addStretch()
-            
-            toggle_mode_button = QPushButton("🌙" if self.mode == 0 else "☀️")
-            toggle_mode_button.setStyleSheet(Style(self.mode).style_sheet(2))
-            toggle_mode_button.clicked.connect(lambda: self.toggle_mode())
-            toggle_mode_button.setFixedWidth(120)
-            toggle_mode_button.setShortcut("Ctrl+T")
-            toggle_mode_button.setToolTip("Toggle light/dark mode (Ctrl+T)")
-            toggle_layout.addWidget(toggle_mode_button)
-            
-            layout.addLayout(toggle_layout)
+        self.no_projects_widget = QWidget()
+        no_projects_layout = QVBoxLayout(self.no_projects_widget)
+        no_projects_layout.setContentsMargins(0, 0, 0, 0)
+        no_projects_label = QLabel("No current projects.")
+        no_projects_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        no_projects_layout.addStretch(1)
+        no_projects_layout.addWidget(no_projects_label)
+        no_projects_layout.addStretch(1)
+        no_projects_layout.addStretch(2)
+        layout.addWidget(self.no_projects_widget, 1)
+
+        self.projects_layout = QVBoxLayout()
+        layout.addLayout(self.projects_layout)
+
+        layout.addStretch()
+        
+        self.main_toggle_layout = QHBoxLayout()
+        self.main_toggle_layout.addStretch()
+        self.place_toggle_mode_button(self.main_toggle_layout)
+        layout.addLayout(self.main_toggle_layout)
+
+        self.main_view_initialized = True
+
+    def sync_project_rows(self) -> None:
+        """
+        Updates the project rows to match the list of projects.
+        Rows of projects that no longer exist are deleted, rows for new projects are created,
+        and existing rows have their name updated and are moved to match the project order.
+        """
+        rows = self.project_rows
+        layout = self.projects_layout
+        project_ids = {id(project) for project in self.projects}
+
+        for project_id in [project_id for project_id in rows if project_id not in project_ids]:
+            row = rows.pop(project_id)[0]
+            layout.removeWidget(row)
+            row.setParent(None)
+            row.deleteLater()
+
+        for index, project in enumerate(self.projects):
+            project_id = id(project)
+            if project_id not in rows:
+                rows[project_id] = self.create_project_row(project)
+            row, project_label = rows[project_id]
+
+            if project_label.text() != project.name:
+                project_label.setText(project.name)
+
+            if layout.indexOf(row) != index:
+                layout.removeWidget(row)
+                layout.insertWidget(index, row)
+
+    def create_project_row(self, project: Project) -> tuple[QWidget, QPushButton]:
+        """
+        Creates the row of widgets for a project.
+        Args:
+            project (Project): The project to create the row for.
+        Returns:
+            tuple[QWidget, QPushButton]: The row widget and the button showing the project's name.
+        """
+        row = QWidget()
+        horizontal_layout = QHBoxLayout(row)
+        horizontal_layout.setContentsMargins(0, 0, 0, 0)
+        
+        project_label = QPushButton(project.name)
+        project_label.clicked.connect(partial(self.show_project_view, project))
+        project_label.setProperty("large", True)
+        horizontal_layout.addWidget(project_label)
+
+        edit_details_button = QPushButton("Edit Details")
+        edit_details_button.clicked.connect(partial(self.edit_project_details, project))
+        edit_details_button.setProperty("large", True)
+        horizontal_layout.addWidget(edit_details_button)
+
+        delete_project_button = QPushButton("Delete")
+        delete_project_button.clicked.connect(partial(self.delete_project, project))
+        delete_project_button.setProperty("large", True)
+        horizontal_layout.addWidget(delete_project_button)
+
+        return row, project_label
+
+    def place_toggle_mode_button(self, layout) -> None:
+        """
+        Moves the toggle mode button into the layout of the view being shown.
+        Args:
+            layout (QHBoxLayout): The toggle layout of the view being shown.
+        Adding the button to a layout reparents it, which also removes it from the other view's layout.
+        """
+        if layout.indexOf(self.toggle_mode_button) == -1:
+            layout.addWidget(self.toggle_mode_button)
 
     def toggle_mode(self) -> None:
         """
         Toggles the application mode between light and dark.
-        This method changes the mode attribute and updates the style sheet accordingly.
-        It also refreshes the UI to apply the new style.
+        This method changes the mode attribute and updates the style sheet and the toggle mode button accordingly.
+        Qt restyles every widget when the application style sheet changes, so the views are not rebuilt.
         """
         self.mode = 0 if self.mode == 1 else 1
+        self.update_style_sheets()
+        self.toggle_mode_button.setText("🌙" if self.mode == 0 else "☀️")
 
-        self.setStyleSheet(Style(self.mode).style_sheet(1))
+    def update_style_sheets(self) -> None:
+        """
+        Installs the style sheet for the current mode on the application.
+        This method is called on startup and whenever the mode changes. Widgets pick up the
+        button and task row rules through their "large" and "compact" properties, so no widget
+        needs its own style sheet and Qt only parses the style sheet once per mode.
+        """
+        QApplication.instance().setStyleSheet(get_style(self.mode).application_style_sheet())
 
-        self.refresh_ui()
+    def schedule_save(self, projects=None) -> None:
+        """
+        Schedules the projects to be saved to the JSON file.
+        Args:
+            projects (list[Project]): Ignored, accepted so this method can be used as the TaskManager save callback.
+        This method (re)starts a short single-shot timer, so a burst of edits results in a single write.
+        """
+        self.save_timer.start()
+
+    def start_save(self) -> None:
+        """
+        Serializes the projects and writes them to the JSON file on the save thread.
+        Serializing here keeps the worker from reading projects while the UI changes them,
+        and the save pool only has one thread, so writes happen in the order they were started.
+        """
+        self.save_pool.start(SaveProjectsTask(serialize_projects(self.projects)))
+
+    def flush_save(self) -> None:
+        """
+        Saves the projects immediately if a save is pending, and waits for all writes to finish.
+        """
+        if self.save_timer.isActive():
+            self.save_timer.stop()
+            self.start_save()
+        self.save_pool.waitForDone()
+
+    def closeEvent(self, event) -> None:
+        """
+        Handles the window close event.
+        Args:
+            event (QCloseEvent): The close event.
+        This method flushes any pending save before the window closes.
+        """
+        self.flush_save()
+        super().closeEvent(event)
 
     def clear_projects(self) -> None:
         """
@@ -191,11 +368,12 @@ class MainWindow(QMainWindow):
         This method prompts the user with a confirmation dialog and, if confirmed, clears the projects list,
         saves the empty list to the JSON file, and refreshes the UI.
         """
-        item, ok = QInputDialog.getItem(self, "Clear Projects", "Are you sure you want to clear all projects?", ["Yes", "No"])
-        if ok and item == "Yes":
-            self.projects = []
-            save_projects(self.projects)
-            self.refresh_ui()
+        reply = QMessageBox.question(self, "Clear Projects", "Are you sure you want to clear all projects?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if reply == QMessageBox.StandardButton.Yes:
+            self.projects.clear()
+            self.projects_by_name.clear()
+            self.schedule_save()
+            self.request_refresh()
     
     def edit_project_details(self, project: Project, mode="edit") -> None:
         """
@@ -210,8 +388,7 @@ class MainWindow(QMainWindow):
         """
         dialog = QDialog(self)
         dialog.setWindowTitle("Edit Project Details")
-        dialog.setWindowIcon(QIcon("icon.png"))
-        dialog.setStyleSheet(Style(self.mode).style_sheet(1))
+        dialog.setWindowIcon(app_icon())
         dialog.setGeometry(300, 300, 400, 200)
         layout = QVBoxLayout(dialog)
 
@@ -246,31 +423,53 @@ class MainWindow(QMainWindow):
             name = name_edit.text().strip()
             desc = desc_edit.toPlainText().strip()
             
-            if not name and mode == "add":
+            if not name:
                 QMessageBox.warning(self, "Warning", "Project name cannot be empty.")
                 return
-            if project.name in [p.name for p in self.projects if p != project] and mode == "add":
+            existing_project = self.projects_by_name.get(name)
+            if existing_project is not None and existing_project is not project:
                 QMessageBox.warning(self, "Warning", "Project name already exists.")
                 return
             if mode == "edit":
+                self.unindex_project(project)
                 project.name = name
-                if not project.name:
-                    QMessageBox.warning(self, "Warning", "Project name cannot be empty.")
-                    return
-                if project.name in [p.name for p in self.projects if p != project]:
-                    QMessageBox.warning(self, "Warning", "Project name already exists.")
-                    return
                 project.description = desc
+                self.projects_by_name[name] = project
             else:
-                self.projects.append(Project(name=name, description=desc))
-            save_projects(self.projects)
+                new_project = Project(name=name, description=desc)
+                self.projects.append(new_project)
+                self.projects_by_name[name] = new_project
+            self.schedule_save()
             dialog.accept()
-            self.refresh_ui()
+            self.request_refresh()
 
         done_button.clicked.connect(on_done)
 
         dialog.exec()
 
+    def unindex_project(self, project: Project) -> None:
+        """
+        Removes a project from projects_by_name before it is renamed or deleted.
+        Args:
+            project (Project): The project to remove.
+        If another project has the same name, which can only happen with a hand-edited file,
+        the name is passed to that project so it stays reachable through the index.
+        """
+        if self.projects_by_name.get(project.name) is not project:
+            return
+        duplicate = next((other for other in self.projects if other is not project and other.name == project.name), None)
+        if duplicate is None:
+            del self.projects_by_name[project.name]
+        else:
+            self.projects_by_name[project.name] = duplicate
+
+    def request_refresh(self) -> None:
+        """
+        Schedules a UI refresh for the next pass of the event loop.
+        Changes made by several handlers in a row, or before a dialog closes, are shown by a single refresh.
+        """
+        self.refresh_timer.start()
+
     def refresh_ui(self) -> None:
         """
         Refreshes the UI based on the current view.
@@ -291,57 +490,12 @@ class MainWindow(QMainWindow):
         If the user confirms, it removes the project from the projects list, saves the updated list to the JSON file,
         and refreshes the UI.
         """
-        item, ok = QInputDialog.getItem(self, "Delete Project", f"Are you sure you want to delete the project '{project.name}'?", ["Yes", "No"])
-        if ok and item == "Yes":
+        reply = QMessageBox.question(self, "Delete Project", f"Are you sure you want to delete the project '{project.name}'?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if reply == QMessageBox.StandardButton.Yes:
             self.projects.remove(project)
-            save_projects(self.projects)
-            self.refresh_ui()
-
-    def clear_layout(self, layout) -> None:
-        """
-        Clears all widgets from a layout.
-        Args:
-            layout (QLayout): The layout to clear.
-        This method iterates through all items in the layout and removes them,
-        setting their parent to None and deleting them to free up resources.
-        """
-        if layout is None:
-            return
-        
-        while layout.count():
-            child = layout.takeAt(0)
-            if child is not None:
-                widget = child.widget()
-                if widget is not None:
-                    widget.setParent(None)
-                    widget.deleteLater()
-                else:
-                    child_layout = child.layout()
-                    if child_layout is not None:
-                        self.clear_layout(child_layout)
-
-    def clear_layout_content(self, layout) -> None:
-        """
-        Clears all widgets from a layout without deleting the layout itself.
-        Args:
-            layout (QLayout): The layout to clear.
-        This method iterates through all items in the layout and removes them,
-        setting their parent to None and deleting them to free up resources.
-        """
-        if layout is None:
-            return
-        
-        while layout.count():
-            child = layout.takeAt(0)
-            if child is not None:
-                widget = child.widget()
-                if widget is not None:
-                    widget.setParent(None)
-                    widget.deleteLater()
-                else:
-                    child_layout = child.layout()
-                    if child_layout is not None:
-                        self.clear_layout_content(child_layout)
+            self.unindex_project(project)
+            self.schedule_save()
+            self.request_refresh()
 
     def show_project_view(self, project: Project) -> None:
         """
@@ -354,6 +508,7 @@ class MainWindow(QMainWindow):
         self.current_project = project
         self.setWindowTitle(f"Project Manager - Managing {project.name}")
         self.setup_project_view()
+        self.place_toggle_mode_button(self.project_toggle_layout)
         self.stacked_widget.setCurrentWidget(self.project_view)
 
     def show_main_view(self) -> None:
@@ -365,39 +520,56 @@ class MainWindow(QMainWindow):
         self.current_project = None
         self.setWindowTitle("Project Manager")
         self.setup_main_view()
+        self.place_toggle_mode_button(self.main_toggle_layout)
         self.stacked_widget.setCurrentWidget(self.main_view)
 
     def setup_project_view(self) -> None:
         """
         Sets up the project view for managing tasks.
-        This method initializes the layout, adds buttons for adding tasks, clearing tasks,
-        and displays the list of tasks for the current project.
+        The header buttons, the "no tasks" label and the toggle mode button are built once,
+        and the task rows are kept alive between refreshes and updated in place.
         If there are no tasks, it displays a message indicating that there are no tasks for the project.
+        Updates are disabled while the rows change, so the view is repainted once at the end.
         """
         if not self.current_project:
             return
-            
+
         if not self.project_view_initialized:
-            main_layout = QVBoxLayout()
-            self.project_view.setLayout(main_layout)
-            self.project_view_initialized = True
-        else:
-            current_layout = self.project_view.layout()
-            self.clear_layout_content(current_layout)
-        
-        main_layout = self.project_view.layout()
-        assert isinstance(main_layout, QVBoxLayout)
+            self.build_project_view()
+
+        self.project_view.setUpdatesEnabled(False)
+        try:
+            self.no_tasks_label.setText(f"No tasks for {self.current_project.name}.")
+            self.no_tasks_label.setVisible(not self.current_project.tasks)
+            self.clear_tasks_button.setVisible(len(self.current_project.tasks) > 1)
+
+            self.sync_task_rows()
+        finally:
+            self.project_view.setUpdatesEnabled(True)
+
+    def build_project_view(self) -> None:
+        """
+        Builds the persistent widgets of the project view.
+        This method creates the project view and adds it to the stacked widget, so it only exists once a project is opened.
+        It adds the back, add task and clear tasks buttons, the "no tasks" label,
+        the layout holding the task rows and the toggle mode button.
+        """
+        self.project_view = QWidget()
+        self.stacked_widget.addWidget(self.project_view)
+
+        main_layout = QVBoxLayout()
+        self.project_view.setLayout(main_layout)
 
         horizontal_layout = QHBoxLayout()
 
         back_button = QPushButton("Back")
         back_button.clicked.connect(self.show_main_view)
-        back_button.setStyleSheet(Style(self.mode).style_sheet(2))
+        back_button.setProperty("large", True)
         horizontal_layout.addWidget(back_button)
 
         add_task_button = QPushButton("Add Task")
-        add_task_button.clicked.connect(lambda: self.add_task_and_refresh())
-        add_task_button.setStyleSheet(Style(self.mode).style_sheet(2))
+        add_task_button.clicked.connect(self.add_task_and_refresh)
+        add_task_button.setProperty("large", True)
         horizontal_layout.addWidget(add_task_button)
 
         add_task_button.setShortcut("Ctrl+N")
@@ -405,102 +577,174 @@ class MainWindow(QMainWindow):
         back_button.setShortcut("Esc")
         back_button.setToolTip("Go back to the main view (Esc)")
 
-        if len(self.current_project.tasks) > 1:
-            clear_tasks_button = QPushButton("Clear Tasks")
-            clear_tasks_button.clicked.connect(lambda: self.clear_tasks_and_refresh())
-            clear_tasks_button.setStyleSheet(Style(self.mode).style_sheet(2))
-            horizontal_layout.addWidget(clear_tasks_button)
-            clear_tasks_button.setShortcut("Ctrl+C")
-            clear_tasks_button.setToolTip("Clear all tasks in the project (Ctrl+C)")
+        self.clear_tasks_button = QPushButton("Clear Tasks")
+        self.clear_tasks_button.clicked.connect(self.clear_tasks_and_refresh)
+        self.clear_tasks_button.setProperty("large", True)
+        horizontal_layout.addWidget(self.clear_tasks_button)
+        self.clear_tasks_button.setShortcut("Ctrl+C")
+        self.clear_tasks_button.setToolTip("Clear all tasks in the project (Ctrl+C)")
 
         main_layout.addLayout(horizontal_layout)
 
-        if not self.current_project.tasks:
-            no_tasks_label = QLabel(f"No tasks for {self.current_project.name}.")
-            no_tasks_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            main_layout.addWidget(no_tasks_label)
-            
-            main_layout.addStretch()
-            
-            toggle_layout = QHBoxLayout()
-            toggle_layout.addStretch()
-            
-            toggle_mode_button = QPushButton("🌙" if self.mode == 0 else "☀️")
-            toggle_mode_button.setStyleSheet(Style(self.mode).style_sheet(2))
-            toggle_mode_button.clicked.connect(lambda: self.toggle_mode())
-            toggle_mode_button.setFixedWidth(120)
-            toggle_mode_button.setShortcut("Ctrl+T")
-            toggle_mode_button.setToolTip("Toggle light/dark mode (Ctrl+T)")
-            toggle_layout.addWidget(toggle_mode_button)
-            
-            main_layout.addLayout(toggle_layout)
-            return
-        
-        self.current_project.tasks.sort(key=lambda t: t.priority)
-        
-        for task in self.current_project.tasks:
-            task_layout = QHBoxLayout()
-            
-            priority_button = QPushButton(f"#{task.priority}")
-            priority_button.clicked.connect(lambda _, t=task: self.change_priority_and_refresh(t))
-            priority_button.setStyleSheet(Style(self.mode).style_sheet(3))
-            priority_button.setFixedWidth(50)
-            priority_button.setFixedHeight(30)
-            task_layout.addWidget(priority_button)
-            
-            task_checkbox = QCheckBox(task.name)
-            task_checkbox.setChecked(task.completed)
-            task_checkbox.stateChanged.connect(lambda state, t=task: self.task_manager.toggle_task_completion(t, state))
-            task_checkbox.setStyleSheet(Style(self.mode).style_sheet(3))
-            task_checkbox.setFixedHeight(30)
-            task_layout.addWidget(task_checkbox)
-            
-            delete_task_button = QPushButton("Remove Task")
-            delete_task_button.clicked.connect(lambda _, t=task: self.remove_task_and_refresh(t))
-            delete_task_button.setStyleSheet(Style(self.mode).style_sheet(3))
-            delete_task_button.setFixedHeight(30)
-            task_layout.addWidget(delete_task_button)
-            
-            main_layout.addLayout(task_layout)
-        
+        self.no_tasks_label = QLabel()
+        self.no_tasks_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        main_layout.addWidget(self.no_tasks_label)
+
+        self.tasks_layout = QVBoxLayout()
+        main_layout.addLayout(self.tasks_layout)
+
         main_layout.addStretch()
-        
-        toggle_layout = QHBoxLayout()
-        toggle_layout.addStretch()
-        
-        toggle_mode_button = QPushButton("🌙" if self.mode == 0 else "☀️")
-        toggle_mode_button.setStyleSheet(Style(self.mode).style_sheet(2))
-        toggle_mode_button.clicked.connect(lambda: self.toggle_mode())
-        toggle_mode_button.setFixedWidth(120)
-        toggle_mode_button.setShortcut("Ctrl+T")
-        toggle_mode_button.setToolTip("Toggle light/dark mode (Ctrl+T)")
-        toggle_layout.addWidget(toggle_mode_button)
-        
-        main_layout.addLayout(toggle_layout)
+
+        self.project_toggle_layout = QHBoxLayout()
+        self.project_toggle_layout.addStretch()
+        main_layout.addLayout(self.project_toggle_layout)
+
+        self.project_view_initialized = True
+
+    def sync_task_rows(self) -> None:
+        """
+        Updates the task rows to match the tasks of the current project.
+        Rows of tasks that no longer exist are hidden and pooled, rows for new tasks are taken from the pool or created,
+        and existing rows have their priority and completion state updated and are moved to match the task order.
+        """
+        rows = self.task_rows
+        layout = self.tasks_layout
+        tasks = self.current_project.tasks
+        self.tasks_by_id = {id(task): task for task in tasks}
+
+        for task_id in [task_id for task_id in rows if task_id not in self.tasks_by_id]:
+            row_widgets = rows.pop(task_id)
+            layout.removeWidget(row_widgets[0])
+            row_widgets[0].hide()
+            self.task_row_pool.append(row_widgets)
+
+        for index, task in enumerate(tasks):
+            task_id = id(task)
+            if task_id not in rows:
+                rows[task_id] = self.take_task_row(task)
+            row, priority_button, task_checkbox, _ = rows[task_id]
+
+            priority_text = f"#{task.priority}"
+            if priority_button.text() != priority_text:
+                priority_button.setText(priority_text)
+
+            if task_checkbox.isChecked() != task.completed:
+                task_checkbox.blockSignals(True)
+                task_checkbox.setChecked(task.completed)
+                task_checkbox.blockSignals(False)
+
+            if layout.indexOf(row) != index:
+                layout.removeWidget(row)
+                layout.insertWidget(index, row)
+
+    def take_task_row(self, task: Task) -> tuple[QWidget, QPushButton, QCheckBox, QPushButton]:
+        """
+        Returns a row of widgets for a task, reusing a pooled row if there is one.
+        Args:
+            task (Task): The task the row is for.
+        Returns:
+            tuple[QWidget, QPushButton, QCheckBox, QPushButton]: The row widget, its priority button,
+            its completion checkbox and its remove button.
+        The row is pointed at the task through its "task_id" property and its name is updated.
+        Its priority and completion state are left for sync_task_rows to update, like those of any other row.
+        """
+        if not self.task_row_pool:
+            row_widgets = self.create_task_row()
+        else:
+            row_widgets = self.task_row_pool.pop()
+            row_widgets[0].show()
+
+        row_widgets[0].setProperty("task_id", id(task))
+        row_widgets[2].setText(task.name)
+        return row_widgets
+
+    def create_task_row(self) -> tuple[QWidget, QPushButton, QCheckBox, QPushButton]:
+        """
+        Creates the row of widgets for a task.
+        Returns:
+            tuple[QWidget, QPushButton, QCheckBox, QPushButton]: The row widget, its priority button,
+            its completion checkbox and its remove button.
+        The widgets are connected to shared handlers that look up the row's task when they are called,
+        so a row can be reused for another task without reconnecting it.
+        """
+        row = QWidget()
+        task_layout = QHBoxLayout(row)
+        task_layout.setContentsMargins(0, 0, 0, 0)
+
+        priority_button = QPushButton()
+        priority_button.clicked.connect(self.on_priority_clicked)
+        priority_button.setProperty("compact", True)
+        priority_button.setFixedWidth(50)
+        priority_button.setFixedHeight(30)
+        task_layout.addWidget(priority_button)
+
+        task_checkbox = QCheckBox()
+        task_checkbox.stateChanged.connect(self.on_task_state_changed)
+        task_checkbox.setProperty("compact", True)
+        task_checkbox.setFixedHeight(30)
+        task_layout.addWidget(task_checkbox)
+
+        delete_task_button = QPushButton("Remove Task")
+        delete_task_button.clicked.connect(self.on_remove_task_clicked)
+        delete_task_button.setProperty("compact", True)
+        delete_task_button.setFixedHeight(30)
+        task_layout.addWidget(delete_task_button)
+
+        return row, priority_button, task_checkbox, delete_task_button
+
+    def sender_task(self) -> Task | None:
+        """
+        Returns the task of the row whose widget emitted the current signal.
+        Returns:
+            Task | None: The task, or None if the row no longer belongs to a task of the current project.
+        """
+        return self.tasks_by_id.get(self.sender().parentWidget().property("task_id"))
+
+    def on_priority_clicked(self) -> None:
+        """Changes the priority of the task whose priority button was clicked."""
+        task = self.sender_task()
+        if task:
+            self.change_priority_and_refresh(task)
+
+    def on_task_state_changed(self, state) -> None:
+        """
+        Updates the completion of the task whose checkbox changed.
+        Args:
+            state (int): The new state of the checkbox.
+        """
+        task = self.sender_task()
+        if task:
+            self.task_manager.toggle_task_completion(task, state)
+
+    def on_remove_task_clicked(self) -> None:
+        """Removes the task whose remove button was clicked."""
+        task = self.sender_task()
+        if task:
+            self.remove_task_and_refresh(task)
 
     def add_task_and_refresh(self) -> None:
         """Helper method to add a task and refresh the UI."""
         if self.current_project:
             if self.task_manager.add_task(self.current_project, self):
-                self.refresh_ui()
+                self.request_refresh()
 
     def clear_tasks_and_refresh(self) -> None:
         """Helper method to clear tasks and refresh the UI."""
         if self.current_project:
             if self.task_manager.clear_tasks(self.current_project, self):
-                self.refresh_ui()
+                self.request_refresh()
 
     def remove_task_and_refresh(self, task: Task) -> None:
         """Helper method to remove a task and refresh the UI."""
         if self.current_project:
             self.task_manager.remove_task(task, self.current_project)
-            self.refresh_ui()
+            self.request_refresh()
 
     def change_priority_and_refresh(self, task: Task) -> None:
         """Helper method to change task priority and refresh the UI."""
         if self.current_project:
             self.task_manager.change_task_priority(task, self.current_project, self)
-            self.refresh_ui()
+            self.request_refresh()
 
 if __name__ == "__main__":
     """
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Task:
     """
     Class representing a task in a project.
@@ -8,12 +8,13 @@ class Task:
         name (str): The name of the task.
         completed (bool): Whether the task is completed. Defaults to False.
         priority (int): The priority of the task, lower number means higher priority. Defaults to 1.
+    Tasks compare by identity, so membership tests and removals do not compare every field.
     """
     name: str
     completed: bool = False
     priority: int = 1
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Project:
     """
     Class representing a project containing multiple tasks.
@@ -21,6 +22,7 @@ class Project:
         name (str): The name of the project.
         description (str): A description of the project. Defaults to "No description provided."
         tasks (list[Task]): A list of tasks associated with the project.
+    Projects compare by identity, so membership tests and removals do not compare every task.
     """
     name: str
     description: str = "No description provided."
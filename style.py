@@ -1,123 +1,169 @@
-class Style:
-    """
-    Class to manage the styling of the application.
-    Attributes:
-        BACKGROUND_COLOR (str): The background color of the application.
-        FOREGROUND_COLOR (str): The foreground color of the application.
-        ITEMS_COLOR (str): The color of items in the application.
-        ITEMS_HOVER_COLOR (str): The hover color for items in the application.
-    Methods:
-        __init__(mode): Initializes the style based on the provided mode (0 for dark mode, 1 for light mode).
-        style_sheet(sheet): Returns a string containing the CSS style sheet for the specified sheet.
-    This class allows for easy switching between light and dark modes by changing the color scheme.
-    """
-    def __init__(self, mode) -> None:
-        """
-        Initialize the style based on the provided mode.
-        Args:
-            mode (int): The mode for the style. 0 for dark mode, 1 for light mode.
-        Sets the background, foreground, items, and hover colors based on the mode.
-        """
-        if mode == 0:
-            self.BACKGROUND_COLOR, self.FOREGROUND_COLOR, self.ITEMS_COLOR, self.ITEMS_HOVER_COLOR = "#212529", "#FFFFFF", "#343A40", "#495057"
-        elif mode == 1:
-            self.BACKGROUND_COLOR, self.FOREGROUND_COLOR, self.ITEMS_COLOR, self.ITEMS_HOVER_COLOR = "#F8F9FA", "#212529", "#E9ECEF", "#CED4DA"
+from functools import cache
+from string import Template
 
-    def style_sheet(self, sheet) -> str:
-        """
-        Returns a string containing the CSS style sheet for the specified sheet.
-        Args:
-            sheet (int): The sheet number for which to return the style. 
-                         1 for main window styles, 2 for button styles, 3 for checkbox and button hover styles.
-        Returns:
-            str: A string containing the CSS style sheet for the specified sheet.
-        This method allows for different styles to be applied based on the context of the application.
-        """
-        if sheet == 1:
-            return f"""
-            QMainWindow {{
-                background-color: {self.BACKGROUND_COLOR};
-                color: {self.FOREGROUND_COLOR};
+# The colors of each mode, indexed by mode (0 for dark mode, 1 for light mode).
+_PALETTES = (
+    {"BACKGROUND_COLOR": "#212529", "FOREGROUND_COLOR": "#FFFFFF", "ITEMS_COLOR": "#343A40", "ITEMS_HOVER_COLOR": "#495057"},
+    {"BACKGROUND_COLOR": "#F8F9FA", "FOREGROUND_COLOR": "#212529", "ITEMS_COLOR": "#E9ECEF", "ITEMS_HOVER_COLOR": "#CED4DA"},
+)
+
+_SHEET_TEMPLATES = {
+    1: Template("""
+            QMainWindow {
+                background-color: $BACKGROUND_COLOR;
+                color: $FOREGROUND_COLOR;
                 font-family: Arial, sans-serif;
                 font-size: 18px;
-            }}
+            }
                 
-            QWidget {{
-                background-color: {self.BACKGROUND_COLOR};
-                color: {self.FOREGROUND_COLOR};
+            QWidget {
+                background-color: $BACKGROUND_COLOR;
+                color: $FOREGROUND_COLOR;
                 font-family: Arial, sans-serif;
                 font-size: 18px;
-            }}
+            }
             
-            QLineEdit, QTextEdit {{
-                background-color: {self.ITEMS_COLOR};
+            QLineEdit, QTextEdit {
+                background-color: $ITEMS_COLOR;
                 border-radius: 5px;
                 padding: 5px;
                 font-family: Arial, sans-serif;
                 font-size: 18px;
-            }}
+            }
             
-            QPushButton {{
-                background-color: {self.ITEMS_COLOR};
+            QPushButton {
+                background-color: $ITEMS_COLOR;
                 border-radius: 5px;
                 font-family: Arial, sans-serif;
                 font-size: 18px;
-            }}
+            }
             
-            QPushButton:hover{{
-                background-color: {self.ITEMS_HOVER_COLOR};
-            }}
+            QPushButton:hover{
+                background-color: $ITEMS_HOVER_COLOR;
+            }
             
-            QCheckBox {{
-                background-color: {self.ITEMS_COLOR};
+            QCheckBox {
+                background-color: $ITEMS_COLOR;
                 border-radius: 5px;
                 padding: 5px;
                 font-family: Arial, sans-serif;
                 font-size: 18px;
-            }}
+            }
             
-            QLabel {{
+            QLabel {
                 font-family: Arial, sans-serif;
                 font-size: 18px;
-            }}
+            }
 
-            QToolTip {{
-                background-color: {self.ITEMS_COLOR};
-                border: 1px solid {self.ITEMS_HOVER_COLOR};
+            QToolTip {
+                background-color: $ITEMS_COLOR;
+                border: 1px solid $ITEMS_HOVER_COLOR;
                 border-radius: 5px;
-                color: {self.FOREGROUND_COLOR};
+                color: $FOREGROUND_COLOR;
                 padding: 5px;
                 font-family: Arial, sans-serif;
                 font-size: 18px;
-            }}
-            """
-        elif sheet == 2:
-            return """
-            QPushButton {
+            }
+            """),
+    2: Template("""
+            QPushButton[large="true"] {
                 height: 50px;
             }
-            """
-        elif sheet == 3:
-            return f"""
-            QCheckBox {{
-                background-color: {self.ITEMS_COLOR};
+            """),
+    3: Template("""
+            QCheckBox[compact="true"] {
+                background-color: $ITEMS_COLOR;
                 border-radius: 5px;
                 padding: 5px;
-            }}
+            }
             
-            QPushButton {{
-                background-color: {self.ITEMS_COLOR};
+            QPushButton[compact="true"] {
+                background-color: $ITEMS_COLOR;
                 border-radius: 5px;
                 padding: 5px;
-            }}
+            }
             
-            QPushButton:hover {{
-                background-color: {self.ITEMS_HOVER_COLOR};
-            }}
+            QPushButton[compact="true"]:hover {
+                background-color: $ITEMS_HOVER_COLOR;
+            }
             
-            QCheckBox:hover {{
-                background-color: {self.ITEMS_HOVER_COLOR};
-            }}
-            """
-        else:
-            return """"""
+            QCheckBox[compact="true"]:hover {
+                background-color: $ITEMS_HOVER_COLOR;
+            }
+            """),
+}
+
+# The style sheets of every mode, filled in once when the module is imported.
+_RENDERED_SHEETS = tuple(
+    {sheet: template.substitute(colors) for sheet, template in _SHEET_TEMPLATES.items()}
+    for colors in _PALETTES
+)
+
+class Style:
+    """
+    Class to manage the styling of the application.
+    Attributes:
+        BACKGROUND_COLOR (str): The background color of the application.
+        FOREGROUND_COLOR (str): The foreground color of the application.
+        ITEMS_COLOR (str): The color of items in the application.
+        ITEMS_HOVER_COLOR (str): The hover color for items in the application.
+        sheets (dict[int, str]): The style sheets for this style's mode, keyed by sheet number.
+    Methods:
+        __init__(mode): Initializes the style based on the provided mode (0 for dark mode, 1 for light mode).
+        style_sheet(sheet): Returns a string containing the CSS style sheet for the specified sheet.
+        application_style_sheet(): Returns the combined style sheet to install on the application.
+    This class allows for easy switching between light and dark modes by changing the color scheme.
+    """
+    __slots__ = ("BACKGROUND_COLOR", "FOREGROUND_COLOR", "ITEMS_COLOR", "ITEMS_HOVER_COLOR", "sheets")
+
+    def __init__(self, mode) -> None:
+        """
+        Initialize the style based on the provided mode.
+        Args:
+            mode (int): The mode for the style. 0 for dark mode, 1 for light mode.
+        Sets the background, foreground, items, and hover colors based on the mode,
+        and looks up the style sheets already rendered for that mode.
+        """
+        colors = _PALETTES[mode]
+        self.BACKGROUND_COLOR = colors["BACKGROUND_COLOR"]
+        self.FOREGROUND_COLOR = colors["FOREGROUND_COLOR"]
+        self.ITEMS_COLOR = colors["ITEMS_COLOR"]
+        self.ITEMS_HOVER_COLOR = colors["ITEMS_HOVER_COLOR"]
+        self.sheets = _RENDERED_SHEETS[mode]
+
+    def style_sheet(self, sheet) -> str:
+        """
+        Returns a string containing the CSS style sheet for the specified sheet.
+        Args:
+            sheet (int): The sheet number for which to return the style. 
+                         1 for main window styles, 2 for button styles, 3 for checkbox and button hover styles.
+                         Sheet 2 applies to buttons with the "large" property set, sheet 3 to widgets with the "compact" property set.
+        Returns:
+            str: A string containing the CSS style sheet for the specified sheet.
+        This method allows for different styles to be applied based on the context of the application.
+        """
+        return self.sheets.get(sheet, "")
+
+    def application_style_sheet(self) -> str:
+        """
+        Returns the combined style sheet to install on the application.
+        Returns:
+            str: The main window, button, and checkbox style sheets concatenated together.
+        Installing this once on the QApplication lets Qt apply the rules to every widget,
+        instead of parsing a separate style sheet for each widget.
+        """
+        return self.style_sheet(1) + self.style_sheet(2) + self.style_sheet(3)
+
+
+@cache
+def get_style(mode) -> Style:
+    """
+    Returns the shared Style for the provided mode.
+    Args:
+        mode (int): The mode for the style. 0 for dark mode, 1 for light mode.
+    Returns:
+        Style: The Style for the mode, created on first use and reused afterwards.
+    Since a Style's sheets only depend on its mode, one instance per mode is enough,
+    and switching back to a mode reuses its already filled in style sheets.
+    """
+    return Style(mode)
@@ -2,10 +2,28 @@ from PySide6.QtWidgets import (
     QInputDialog, QMessageBox
 )
 from PySide6.QtCore import Qt
-import json
 
 from models import Project, Task
 
+# The value stateChanged reports for a checked checkbox, looked up once instead of on every toggle.
+_CHECKED_VALUE = Qt.CheckState.Checked.value
+
+# Priority choices shown in the priority dialog, extended as projects grow and shared by every dialog.
+_priority_options: list[str] = []
+
+def priority_options(count) -> list[str]:
+    """
+    Returns the priority choices for a project with the given number of tasks.
+    Args:
+        count (int): The number of tasks in the project.
+    Returns:
+        list[str]: The priorities "1" to str(count).
+    The strings are created once and reused, so opening the dialog only copies the references it needs.
+    """
+    if len(_priority_options) < count:
+        _priority_options.extend(str(i) for i in range(len(_priority_options) + 1, count + 1))
+    return _priority_options[:count]
+
 class TaskManager:
     """
     Class for managing tasks within a project.
@@ -18,6 +36,7 @@ class TaskManager:
         clear_tasks(project, parent_widget): Clears all tasks for the specified project after user confirmation.
         add_task(project, parent_widget): Adds a new task to the specified project after user input.
         remove_task(task, project): Removes a task from the specified project.
+        renumber_tasks(project): Sets the priority of each task in the project from its position in the task list.
         toggle_task_completion(task, state): Toggles the completion state of a task.
         change_task_priority(task, project, parent_widget, mode="edit"): Changes the priority of a task within the specified project.
     This class provides methods to manage tasks in a project, including adding new tasks,
@@ -46,8 +65,8 @@ class TaskManager:
         If the user confirms, it clears the tasks list for the project, saves the updated project list to the JSON file,
         and refreshes the UI.
         """
-        item, ok = QInputDialog.getItem(parent_widget, "Clear Tasks", f"Are you sure you want to clear all tasks for '{project.name}'?", ["Yes", "No"])
-        if ok and item == "Yes":
+        reply = QMessageBox.question(parent_widget, "Clear Tasks", f"Are you sure you want to clear all tasks for '{project.name}'?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if reply == QMessageBox.StandardButton.Yes:
             project.tasks.clear()
             self.save_callback(self.projects)
             return True
@@ -70,7 +89,7 @@ class TaskManager:
         if not ok or not task_name.strip():
             return False
             
-        if task_name in [t.name for t in project.tasks]:
+        if task_name in {t.name for t in project.tasks}:
             QMessageBox.warning(parent_widget, "Warning", "Task name already exists.")
             return False
 
@@ -88,13 +107,26 @@ class TaskManager:
         Args:
             task (Task): The task to remove from the project.
             project (Project): The project from which to remove the task.
-        This method removes the specified task from the project's task list,
-        saves the updated project list to the JSON file.
+        This method removes the specified task from the project's task list, renumbers the remaining tasks,
+        and saves the updated project list to the JSON file.
         """
         if project and task in project.tasks:
             project.tasks.remove(task)
+            self.renumber_tasks(project)
             self.save_callback(self.projects)
     
+    @staticmethod
+    def renumber_tasks(project: Project) -> None:
+        """
+        Sets the priority of each task in the project from its position in the task list.
+        Args:
+            project (Project): The project whose tasks should be renumbered.
+        The task list is kept in priority order and load_projects numbers tasks by position the same way,
+        so priorities always match list positions and this single pass is all that is needed after tasks are moved or removed.
+        """
+        for index, task in enumerate(project.tasks, 1):
+            task.priority = index
+
     def toggle_task_completion(self, task: Task, state) -> None:
         """
         Toggles the completion state of a task.
@@ -102,9 +134,12 @@ class TaskManager:
             task (Task): The task whose completion state is to be toggled.
             state (Qt.CheckState): The new state of the task's completion checkbox.
         This method updates the task's completed attribute based on the checkbox state,
-        and saves the updated project list to the JSON file.
+        and saves the updated project list to the JSON file. Nothing is saved if the state is unchanged.
         """
-        task.completed = (state == Qt.CheckState.Checked.value)
+        completed = (state == _CHECKED_VALUE)
+        if task.completed == completed:
+            return
+        task.completed = completed
         self.save_callback(self.projects)
 
     def change_task_priority(self, task: Task, project: Project, parent_widget, mode="edit") -> None:
@@ -119,8 +154,8 @@ class TaskManager:
         where a lower number indicates a higher priority.
         If the mode is "add", it allows the user to select a priority for the new task.
         If the mode is "edit", it allows the user to change the priority of an existing task.
-        If the new priority is different from the old priority, it adjusts the priorities of other tasks accordingly,
-        ensuring that no two tasks have the same priority.
+        If the new priority is different from the old priority, it moves the task to its new position in the project's
+        task list and renumbers all tasks by their position, keeping the list ordered by priority.
         """
         if not project:
             return
@@ -136,30 +171,20 @@ class TaskManager:
 
         num_tasks = len(project.tasks)
         
-        priority_options = [str(i) for i in range(1, num_tasks + 1)]
-        
         priority, ok = QInputDialog.getItem(
             parent_widget,
             prompt_title,
             prompt,
-            priority_options,
+            priority_options(num_tasks),
             min(task.priority - 1, num_tasks - 1)
         )
         
         if ok and priority:
             new_priority = int(priority)
-            old_priority = task.priority
-            
-            if new_priority != old_priority:
-                if new_priority < old_priority:
-                    for t in project.tasks:
-                        if t != task and new_priority <= t.priority < old_priority:
-                            t.priority += 1
-                else:
-                    for t in project.tasks:
-                        if t != task and old_priority < t.priority <= new_priority:
-                            t.priority -= 1
             
-                task.priority = new_priority
+            if new_priority != task.priority:
+                project.tasks.remove(task)
+                project.tasks.insert(new_priority - 1, task)
+                self.renumber_tasks(project)
                 
                 self.save_callback(self.projects)